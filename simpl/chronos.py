@@ -24,9 +24,15 @@ Our APIs consitently return date/time in the API_FORMAT format.
 """
 
 import datetime
+import re
 import time
 
+from simpl.utils import caching
+
 API_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+#: Matches the zero-padded strings produced by formatting with API_FORMAT
+API_FORMAT_REGEX = re.compile(
+    r'^([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})Z\Z')
 
 
 def get_time_string(time_gmt=None):
@@ -49,6 +55,12 @@ def get_time_string(time_gmt=None):
                     "was passed." % type(time_gmt))
 
 
+@caching.lru_cache(maxsize=1024)
 def parse_time_string(time_string):
     """Convert date/time in API_FORMAT to a datetime."""
+    match = API_FORMAT_REGEX.match(time_string)
+    if match:
+        # datetime() still rejects out of range values, e.g. a 13th month
+        return datetime.datetime(*[int(part) for part in match.groups()])
+    # strptime also accepts fields that are not zero-padded
     return datetime.datetime.strptime(time_string, API_FORMAT)
@@ -14,7 +14,6 @@
 
 """Simpl's base module for its command line interface."""
 
-import functools
 import logging
 
 from simpl import server
@@ -41,20 +40,21 @@ def default_subparser():
     return SUBPARSER
 
 
+#
+# `simpl server`
+#
+SERVER_PARSER = server.attach_parser(default_subparser())
+SERVER_PARSER.set_defaults(_func=server.main)
+
+
 def main(argv=None):
     """Entry point for the `simpl` command."""
-    #
-    # `simpl server`
-    #
     logging.basicConfig(level=logging.INFO)
-    server_func = functools.partial(server.main, argv=argv)
-    server_parser = server.attach_parser(default_subparser())
-    server_parser.set_defaults(_func=server_func)
 
     # the following code shouldn't need to change when
     # we add a new subcommand.
     args = default_parser().parse_args(argv)
-    args._func()
+    args._func(argv=argv)
 
 
 if __name__ == '__main__':
@@ -217,6 +217,8 @@ class Option(object):
         'dest' of "key".
     """
 
+    __slots__ = ('args', 'kwargs', '_action', '_mutexgroup')
+
     def __init__(self, *args, **kwargs):
         """Initialize options."""
         self.args = args or []
@@ -229,9 +231,11 @@ class Option(object):
         cpargs = copy.copy(self.args)
         cpkwargs = copy.copy(self.kwargs)
         newone = type(self)(*cpargs, **cpkwargs)
-        updater = {k: v for k, v in copy.copy(self.__dict__).items()
-                   if k not in ('args', 'kwargs')}
-        newone.__dict__.update(updater)
+        newone._action = self._action
+        newone._mutexgroup = self._mutexgroup
+        if hasattr(self, '__dict__'):
+            # attributes added by subclasses without __slots__
+            newone.__dict__.update(copy.copy(self.__dict__))
         assert newone.kwargs is not self.kwargs
         return newone
 
@@ -371,9 +375,18 @@ class Config(collections.MutableMapping):
         self._parser_class = argparser_class
         self._parser = self._parser_class(**parser_kwargs)
         self._prog = None
+        self._parser_cache = {}
         self.ini_config = None
         self.pass_thru_args = []
 
+    def __copy__(self):
+        """Shallow copy with its own values dict and parser cache."""
+        newone = type(self).__new__(type(self))
+        newone.__dict__.update(self.__dict__)
+        newone._values = dict(self._values)
+        newone._parser_cache = {}
+        return newone
+
     @classmethod
     def init(cls, *args, **kwargs):
         """Initialize the config like as you would a regular dict."""
@@ -441,15 +454,25 @@ class Config(collections.MutableMapping):
         """Check number of config options."""
         return len(self._values)
 
+    def __eq__(self, other):
+        """Compare configs by their values."""
+        if isinstance(other, Config):
+            return self._values == other._values
+        return super(Config, self).__eq__(other)
+
+    def __ne__(self, other):
+        """Compare configs by their values."""
+        return not self == other
+
     def __getattr__(self, attr):
         """Get attribute."""
         # protection from infinite recursion when __init__
         # is skipped during object creation (probably copy.copy)
         if attr == '_values':
             raise AttributeError()
-        if attr in self._values:
+        try:
             return self._values[attr]
-        else:
+        except KeyError:
             raise AttributeError("'config' object has no attribute '%s'"
                                  % attr)
 
@@ -479,6 +502,23 @@ class Config(collections.MutableMapping):
             option.add_argument(parser, permissive=permissive)
         return parser
 
+    def _cached_parser(self, name, builder):
+        """Return the parser cached under `name` or build it with `builder`.
+
+        Cached parsers are rebuilt when the options list changes.
+        """
+        options = tuple(self._options)
+        cached = self._parser_cache.get(name)
+        if cached is not None and cached[0] == options:
+            return cached[1]
+        parser = builder()
+        self._parser_cache[name] = (options, parser)
+        return parser
+
+    def invalidate_parser(self):
+        """Discard cached parsers (call after modifying an Option)."""
+        self._parser_cache.clear()
+
     def cli_values(self, argv):
         """Parse command-line arguments into values.
 
@@ -486,16 +526,7 @@ class Config(collections.MutableMapping):
         returns arguments that are explicitly supplied, so we strip out
         defaults and validation rules like `required` in this call.
         """
-        options = []
-        for option in self._options:
-            kwargs = option.kwargs.copy()
-            # Must explicitly set default to None or `store_true` and
-            # `store_false` actions will set the value to true or false,
-            # respectively.
-            kwargs['default'] = None
-            kwargs['required'] = False
-            options.append(Option(*option.args, **kwargs))
-        parser = self.build_parser(options, add_help=False)
+        parser = self._cached_parser('cli', self._build_cli_parser)
         parsed, extras = parser.parse_known_args(argv[1:] if argv else [])
         if extras and argv:
             valid, pass_thru = self.parse_passthru_args(argv[1:])
@@ -508,6 +539,19 @@ class Config(collections.MutableMapping):
 
         return {k: v for k, v in vars(parsed).items() if v is not None}
 
+    def _build_cli_parser(self):
+        """Build the parser used by cli_values."""
+        options = []
+        for option in self._options:
+            kwargs = option.kwargs.copy()
+            # Must explicitly set default to None or `store_true` and
+            # `store_false` actions will set the value to true or false,
+            # respectively.
+            kwargs['default'] = None
+            kwargs['required'] = False
+            options.append(Option(*option.args, **kwargs))
+        return self.build_parser(options, add_help=False)
+
     def validate_config(self, values, argv=None, strict=False):
         """Validate all config values through the command-line parser.
 
@@ -592,6 +636,12 @@ class Config(collections.MutableMapping):
 
     def get_defaults(self):
         """Use argparse to determine and return dict of defaults."""
+        parser = self._cached_parser('defaults', self._build_defaults_parser)
+        parsed, _ = parser.parse_known_args([])
+        return vars(parsed)
+
+    def _build_defaults_parser(self):
+        """Build the parser used by get_defaults."""
         # dont need 'required' to determine the default
         options = [copy.copy(opt) for opt in self._options]
         for opt in options:
@@ -599,9 +649,7 @@ class Config(collections.MutableMapping):
                 del opt.kwargs['required']
             except KeyError:
                 pass
-        parser = self.build_parser(options, permissive=True, add_help=False)
-        parsed, _ = parser.parse_known_args([])
-        return vars(parsed)
+        return self.build_parser(options, permissive=True, add_help=False)
 
     def parse_ini(self, paths=None, namespace=None, permissive=False):
         """Parse config files and return configuration options.
@@ -869,17 +917,14 @@ def read_from(value):
 
 def comma_separated_strings(value):
     """Handle comma-separated arguments passed in command-line."""
+    if isinstance(value, str):
+        return value.split(",")
     return [str(v) for v in value.split(",")]
 
 
 def comma_separated_pairs(value):
     """Handle comma-separated key/values passed in command-line."""
-    pairs = value.split(",")
-    results = {}
-    for pair in pairs:
-        key, pair_value = pair.split('=')
-        results[key] = pair_value
-    return results
+    return dict(pair.split('=') for pair in value.split(","))
 
 
 def parse_key_format(value):
@@ -122,17 +122,21 @@ def git_init(repo_dir):
     return execute_git_command(['git', 'init'], repo_dir=repo_dir)
 
 
-def git_clone(target_dir, repo_location, branch_or_tag=None, verbose=True):
+def git_clone(target_dir, repo_location, branch_or_tag=None, verbose=True,
+              hardlinks=False):
     """Clone repo at repo_location to target_dir and checkout branch_or_tag.
 
     If branch_or_tag is not specified, the HEAD of the primary
     branch of the cloned repo is checked out.
+
+    When repo_location is a local directory, its objects are copied
+    unless `hardlinks` is True, in which case git may hardlink them.
     """
     target_dir = pipes.quote(target_dir)
     command = ['git', 'clone']
     if verbose:
         command.append('--verbose')
-    if os.path.isdir(repo_location):
+    if not hardlinks and os.path.isdir(repo_location):
         command.append('--no-hardlinks')
     command.extend([pipes.quote(repo_location), target_dir])
     if branch_or_tag:
@@ -488,7 +492,7 @@ class GitRepo(object):
 
     @classmethod
     def clone(cls, repo_location, repo_dir=None,
-              branch_or_tag=None, temp=False):
+              branch_or_tag=None, temp=False, hardlinks=False):
         """Clone repo at repo_location into repo_dir and checkout branch_or_tag.
 
         Defaults into current working directory if repo_dir is not supplied.
@@ -501,6 +505,8 @@ class GitRepo(object):
 
         If branch_or_tag is not specified, the HEAD of the primary
         branch of the cloned repo is checked out.
+
+        See :func:`git_clone` for `hardlinks`.
         """
         if temp:
             reponame = repo_location.rsplit('/', 1)[-1]
@@ -509,7 +515,8 @@ class GitRepo(object):
             repo_dir = create_tempdir(suffix=suffix, delete=True)
         else:
             repo_dir = repo_dir or os.getcwd()
-        git_clone(repo_dir, repo_location, branch_or_tag=branch_or_tag)
+        git_clone(repo_dir, repo_location, branch_or_tag=branch_or_tag,
+                  hardlinks=hardlinks)
         # assuming no errors
         return cls(repo_dir)
 
@@ -32,6 +32,8 @@ from simpl import config
 from simpl.utils import cli as cli_utils
 
 LOG = logging.getLogger(__name__)
+# set once XEventletServer has confirmed eventlet.monkey_patch() was called
+_EVENTLET_PATCHED = False
 
 
 def _fill(text):
@@ -185,11 +187,12 @@ class XEventletServer(bottle.ServerAdapter):
         """Create listener socket based on bottle server parameters."""
         import eventlet
 
+        pop_option = self.options.pop
         # Separate out socket.listen arguments
         socket_args = {}
         for arg in ('backlog', 'family'):
             try:
-                socket_args[arg] = self.options.pop(arg)
+                socket_args[arg] = pop_option(arg)
             except KeyError:
                 pass
         # Separate out wrap_ssl arguments
@@ -198,7 +201,7 @@ class XEventletServer(bottle.ServerAdapter):
                     'ssl_version', 'ca_certs', 'do_handshake_on_connect',
                     'suppress_ragged_eofs', 'ciphers'):
             try:
-                ssl_args[arg] = self.options.pop(arg)
+                ssl_args[arg] = pop_option(arg)
             except KeyError:
                 pass
         address = (self.host, self.port)
@@ -213,12 +216,16 @@ class XEventletServer(bottle.ServerAdapter):
 
     def run(self, handler):
         """Start bottle server."""
-        import eventlet.patcher
-        if not eventlet.patcher.is_monkey_patched(os):
-            msg = ("%s requires eventlet.monkey_patch() (before "
-                   "import)" % self.__class__.__name__)
-            raise RuntimeError(msg)
-
+        global _EVENTLET_PATCHED  # pylint: disable=W0603
+        if not _EVENTLET_PATCHED:
+            import eventlet.patcher
+            if not eventlet.patcher.is_monkey_patched(os):
+                msg = ("%s requires eventlet.monkey_patch() (before "
+                       "import)" % self.__class__.__name__)
+                raise RuntimeError(msg)
+            _EVENTLET_PATCHED = True
+
+        pop_option = self.options.pop
         # Separate out wsgi.server arguments
         wsgi_args = {}
         for arg in ('log', 'environ', 'max_size', 'max_http_version',
@@ -227,14 +234,14 @@ class XEventletServer(bottle.ServerAdapter):
                     'log_output', 'log_format', 'url_length_limit', 'debug',
                     'socket_timeout', 'capitalize_response_headers'):
             try:
-                wsgi_args[arg] = self.options.pop(arg)
+                wsgi_args[arg] = pop_option(arg)
             except KeyError:
                 pass
         if 'log_output' not in wsgi_args:
             wsgi_args['log_output'] = not self.quiet
 
         import eventlet.wsgi
-        sock = self.options.pop('shared_socket', None) or self.get_socket()
+        sock = pop_option('shared_socket', None) or self.get_socket()
         eventlet.wsgi.server(sock, handler, **wsgi_args)
 
     def __repr__(self):
@@ -298,14 +305,17 @@ def fmt_pairs(obj, indent=4, sort_key=None):
             B 5
             Z 1
     """
-    lengths = [len(x[0]) for x in obj]
-    if not lengths:
+    pairs = []
+    longest = 0
+    for key, value in obj:
+        if len(key) > longest:
+            longest = len(key)
+        pairs.append((key, value))
+    if not pairs:
         return ''
-    longest = max(lengths)
-    obj = sorted(obj, key=sort_key)
+    pairs.sort(key=sort_key)
     formatter = '%s{: <%d} {}' % (' ' * indent, longest)
-    string = '\n'.join([formatter.format(k, v) for k, v in obj])
-    return string
+    return '\n'.join([formatter.format(k, v) for k, v in pairs])
 
 
 def fmt_routes(bottle_app):
@@ -351,8 +361,12 @@ def build_application(conf):
         return _app
 
     bottle_app = _find_bottle_app(conf.app)
-    bottle_app.route(
-        path='/_simpl', method='GET', callback=_version_callback)
+    # only register simpl's routes once per app, even if run() is
+    # called more than once
+    if not getattr(bottle_app, '_simpl_routes_added', False):
+        bottle_app.route(
+            path='/_simpl', method='GET', callback=_version_callback)
+        bottle_app._simpl_routes_added = True
 
     def _show_routes():
         """Conditionally print the app's routes."""
@@ -46,21 +46,43 @@ Usage:
     t = threading.Thread(target=foo_is_none, args=(threadlocal.default(),))
     t.start()
     t.join()
+
+The data is stored in a :class:`threading.local`, so asyncio tasks running
+on the same thread share it. Under eventlet's monkey patching each greenlet
+gets its own copy.
 """
 
-import collections
 import threading
 
+try:
+    from collections import abc as collections_abc
+except ImportError:  # python 2
+    import collections as collections_abc
+
+from six.moves import intern  # pylint: disable=redefined-builtin
+
 THREAD_STORE = threading.local()
 DEFAULT_NAMESPACE = 'call_context'
 
 
-class ThreadLocalDict(collections.MutableMapping):
+class ThreadLocalDict(object):
+
+    """A dict whose data is local to the thread.
+
+    Each method calls straight through to the underlying thread-local
+    :class:`dict`. The class is registered as a
+    :class:`~collections.abc.MutableMapping` rather than inheriting its
+    slower pure-python mixin methods.
+    """
 
-    """A dict whose data is local to the thread."""
+    __slots__ = ('namespace', 'args', 'kwargs')
+    __hash__ = None
 
     def __init__(self, namespace, *args, **kwargs):
         """Add namespace to dict constructor."""
+        if isinstance(namespace, str):
+            # namespace is hashed on every access to the local store
+            namespace = intern(namespace)
         self.namespace = namespace
         self.args = args
         self.kwargs = kwargs
@@ -72,12 +94,13 @@ class ThreadLocalDict(collections.MutableMapping):
 
     def _get_local_dict(self):
         """Retrieve (or initialize) the thread-local data to use."""
-        try:
-            return getattr(THREAD_STORE, self.namespace)
-        except AttributeError:
-            local_var = dict(*self.args, **self.kwargs)
-            setattr(THREAD_STORE, self.namespace, local_var)
-            return local_var
+        # threading.local's __dict__ is the current thread's storage
+        store = THREAD_STORE.__dict__
+        local_var = store.get(self.namespace)
+        if local_var is None:
+            local_var = store[self.namespace] = dict(*self.args,
+                                                     **self.kwargs)
+        return local_var
 
     def __len__(self):
         """Return the length of the thread-local dict."""
@@ -97,8 +120,60 @@ class ThreadLocalDict(collections.MutableMapping):
 
     def __delitem__(self, key):
         """Delete item from the thread-local dict."""
-        self._get_local_dict().__delitem__(key)
+        del self._get_local_dict()[key]
+
+    def __contains__(self, key):
+        """Check for key in the thread-local dict."""
+        return key in self._get_local_dict()
+
+    def __eq__(self, other):
+        """Compare the thread-local dict with `other`."""
+        if isinstance(other, ThreadLocalDict):
+            other = other._get_local_dict()  # pylint: disable=W0212
+        return self._get_local_dict() == other
+
+    def __ne__(self, other):
+        """Compare the thread-local dict with `other`."""
+        return not self == other
+
+    def get(self, key, default=None):
+        """Get item from the thread-local dict or return `default`."""
+        return self._get_local_dict().get(key, default)
+
+    def pop(self, key, *default):
+        """Remove and return item from the thread-local dict."""
+        return self._get_local_dict().pop(key, *default)
+
+    def popitem(self):
+        """Remove and return an arbitrary item from the thread-local dict."""
+        return self._get_local_dict().popitem()
+
+    def setdefault(self, key, default=None):
+        """Get item from the thread-local dict, setting it if missing."""
+        return self._get_local_dict().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        """Update the thread-local dict."""
+        self._get_local_dict().update(*args, **kwargs)
+
+    def keys(self):
+        """Return the keys of the thread-local dict."""
+        return self._get_local_dict().keys()
+
+    def values(self):
+        """Return the values of the thread-local dict."""
+        return self._get_local_dict().values()
+
+    def items(self):
+        """Return the items of the thread-local dict."""
+        return self._get_local_dict().items()
+
+    def clear(self):
+        """Remove all items from the thread-local dict."""
+        self._get_local_dict().clear()
+
 
+collections_abc.MutableMapping.register(ThreadLocalDict)
 
 CONTEXT = ThreadLocalDict(DEFAULT_NAMESPACE)
 
@@ -0,0 +1,28 @@
+# Copyright (c) 2011-2015 Rackspace US, Inc.
+#
+# All Rights Reserved.
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""Caching utilities."""
+
+import functools
+
+
+def lru_cache(maxsize=128):
+    """Memoize a function using :func:`functools.lru_cache`.
+
+    On python 2, where functools.lru_cache does not exist, the decorated
+    function is returned as is.
+    """
+    if hasattr(functools, 'lru_cache'):
+        return functools.lru_cache(maxsize=maxsize)
+    return lambda func: func
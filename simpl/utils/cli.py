@@ -51,17 +51,18 @@ class HelpfulParser(argparse.ArgumentParser):
 
 def kwarg(string, separator='='):
     """Return a dict from a delimited string."""
-    if separator not in string:
+    key, sep, value = string.partition(separator)
+    if not sep:
         raise ValueError("Separator '%s' not in value '%s'"
                          % (separator, string))
-    if string.strip().startswith(separator):
+    stripped = string.strip()
+    if stripped.startswith(separator):
         raise ValueError("Value '%s' starts with separator '%s'"
                          % (string, separator))
-    if string.strip().endswith(separator):
+    if stripped.endswith(separator):
         raise ValueError("Value '%s' ends with separator '%s'"
                          % (string, separator))
-    if string.count(separator) != 1:
+    if separator in value:
         raise ValueError("Value '%s' should only have one '%s' separator"
                          % (string, separator))
-    key, value = string.split(separator)
     return {key: value}
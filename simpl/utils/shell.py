@@ -15,17 +15,30 @@
 """Shell (subprocess) utilities."""
 
 import logging
-import pipes
-import shlex
 import subprocess
 
 import six
 
 from simpl import exceptions
+from simpl.utils import caching
 
 LOG = logging.getLogger(__name__)
 
 
+@caching.lru_cache(maxsize=256)
+def _split_command(command):
+    """Split a command string into a tuple of args using shlex."""
+    import shlex
+    return tuple(shlex.split(command))
+
+
+def _command_string(command):
+    """Return `command` as a string for logging and error messages."""
+    if isinstance(command, list):
+        return " ".join(command)
+    return command
+
+
 def execute(command, cwd=None, strip=True):
     """Execute a shell command (containing no shell operators) locally.
 
@@ -60,23 +73,21 @@ def execute(command, cwd=None, strip=True):
     sends all stderr to stdout.
     """
     if isinstance(command, six.string_types):
-        cmd = shlex.split(command)
+        cmd = list(_split_command(command))
         LOG.debug("Command after split: %s", cmd)
     elif isinstance(command, list):
         cmd = command
-        command = " ".join(cmd)
     else:
         raise TypeError("'command' should be a string or a list")
-    LOG.debug("Executing `%s` on local machine", command)
-    if cwd:
-        cwd = pipes.quote(cwd)
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("Executing `%s` on local machine", _command_string(command))
     pope = subprocess.Popen(
         cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=cwd,
         universal_newlines=True)
-    out, err = pope.communicate()
-    assert not err
+    # stderr is merged into stdout, so there is only one stream to read
+    out = pope.communicate()[0]
     out = out.strip() if strip else out
     if pope.returncode != 0:
         raise exceptions.SimplCalledProcessError(
-            pope.returncode, command, output=out)
+            pope.returncode, _command_string(command), output=out)
     return out
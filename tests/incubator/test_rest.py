@@ -24,6 +24,20 @@ from simpl import rest as simpl_rest
 from simpl.incubator import rest
 from simpl.middleware import errors as errors_middleware
 
+BODY_SCHEMA = volup.Schema({
+    'a': int,
+    'b': [str],
+})
+BODY_COERCE_SCHEMA = volup.Schema({
+    'a': volup.Coerce(int),
+    'b': [volup.Coerce(str)],
+})
+QUERY_SCHEMA = volup.Schema({
+    'a': rest.coerce_one(str),
+    'b': rest.coerce_many(int),
+})
+
+
 class TestSchemaDecorator(unittest.TestCase):
 
     def setUp(self):
@@ -54,11 +68,7 @@ class TestSchemaDecorator(unittest.TestCase):
         self.assertEqual(dict(body={'a': 1}), result.json)
 
     def test_body_schema_no_body(self):
-        body_schema = volup.Schema({
-            'a': int,
-            'b': [str],
-        })
-        self.callback = rest.schema(body_schema=body_schema)(self.callback)
+        self.callback = rest.schema(body_schema=BODY_SCHEMA)(self.callback)
 
         self.root_app.route('/foo', method='POST', callback=self.callback)
         # Empty request body
@@ -67,11 +77,8 @@ class TestSchemaDecorator(unittest.TestCase):
         self.assertEqual(400, result.status_int)
 
     def test_body_schema_with_body(self):
-        body_schema = volup.Schema({
-            'a': volup.Coerce(int),
-            'b': [volup.Coerce(str)],
-        })
-        self.callback = rest.schema(body_schema=body_schema)(self.callback)
+        self.callback = rest.schema(
+            body_schema=BODY_COERCE_SCHEMA)(self.callback)
 
         self.root_app.route('/foo', method='POST', callback=self.callback)
         result = self.app.post_json('/foo', dict(a='1', b=['foo', 'bar']),
@@ -121,10 +128,7 @@ class TestSchemaDecorator(unittest.TestCase):
         self.assertEqual(400, result.status_int)
 
     def test_query_schema(self):
-        self.callback = rest.schema(query_schema=volup.Schema({
-            'a': rest.coerce_one(str),
-            'b': rest.coerce_many(int),
-        }))(self.callback)
+        self.callback = rest.schema(query_schema=QUERY_SCHEMA)(self.callback)
 
         self.root_app.route('/foo', callback=self.callback)
         result = self.app.get('/foo?a=foo&b=1&b=2&b=3')
@@ -135,10 +139,7 @@ class TestSchemaDecorator(unittest.TestCase):
         )
 
     def test_query_schema_fail(self):
-        self.callback = rest.schema(query_schema=volup.Schema({
-            'a': rest.coerce_one(str),
-            'b': rest.coerce_many(int),
-        }))(self.callback)
+        self.callback = rest.schema(query_schema=QUERY_SCHEMA)(self.callback)
 
         self.root_app.route('/foo', callback=self.callback)
         # There are two values for `a`. We only expect one.
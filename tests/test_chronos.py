@@ -49,6 +49,22 @@ class TestChronos(unittest.TestCase):
         result = chronos.parse_time_string("2015-10-11T22:33:44Z")
         self.assertEqual(result, datetime.datetime(2015, 10, 11, 22, 33, 44))
 
+    def test_parse_time_string_not_padded(self):
+        result = chronos.parse_time_string("2015-1-2T3:4:5Z")
+        self.assertEqual(result, datetime.datetime(2015, 1, 2, 3, 4, 5))
+
+    def test_parse_time_string_invalid(self):
+        for value in ("2015-13-11T22:33:44Z", "2015-10-11 22:33:44",
+                      "not a time"):
+            with self.assertRaises(ValueError):
+                chronos.parse_time_string(value)
+
+    def test_parse_time_string_trailing_data(self):
+        for value in ("2015-10-11T22:33:44Z\n", "2015-10-11T22:33:44Z ",
+                      "2015-10-11T22:33:44Zjunk"):
+            with self.assertRaises(ValueError):
+                chronos.parse_time_string(value)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,7 @@ except ImportError:
     # Python 3
     from io import StringIO
 
+import os
 import subprocess
 import sys
 import unittest
@@ -20,6 +21,8 @@ from simpl.utils import cli as cli_utils
 
 class TestSimplCLI(unittest.TestCase):
 
+    @unittest.skipUnless(os.environ.get('SIMPL_SMOKE'),
+                         "Set SIMPL_SMOKE to run the installed command.")
     def test_simpl_command_is_there(self):
 
         cmd = ['simpl', '--help']
@@ -29,14 +32,12 @@ class TestSimplCLI(unittest.TestCase):
             msg = 'Error while running `%s`' % subprocess.list2cmdline(cmd)
             self.fail(msg='%s --> %r' % (msg, err))
 
-    def test_help_output(self):
-        cmd = ['simpl', '--help']
-        try:
-            output = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-        except (subprocess.CalledProcessError, OSError) as err:
-            msg = 'Error while running `%s`' % subprocess.list2cmdline(cmd)
-            self.fail(msg='%s --> %r' % (msg, err))
-        self.assertIn('usage', str(output).lower())
+    @mock.patch('sys.stdout', new_callable=StringIO)
+    def test_help_output(self, mock_stdout):
+        with self.assertRaises(SystemExit) as exit_:
+            simpl_cli.main(['--help'])
+        self.assertEqual(exit_.exception.code, 0)
+        self.assertIn('usage', mock_stdout.getvalue().lower())
 
     def test_simpl_global_parser(self):
         parser = simpl_cli.PARSER
@@ -62,6 +63,13 @@ class TestSimplCLI(unittest.TestCase):
             interval=1, quiet=False, server='xtornado', port=8080,
             host='127.0.0.1', debug=False, reloader=True)
 
+    @mock.patch.object(server.bottle, 'run')
+    def test_simpl_server_routes_added_once(self, mock_bottle_run):
+        simpl_cli.main(['server'])
+        simpl_cli.main(['server'])
+        rules = [route.rule for route in bottle.default_app().routes]
+        self.assertEqual(rules.count('/_simpl'), 1)
+
     @mock.patch('sys.stderr', new_callable=StringIO)
     def test_simpl_server_fail(self, mock_stderr):
         with self.assertRaises(SystemExit):
@@ -111,6 +119,33 @@ class TestSimplCLIUtils(unittest.TestCase):
             with self.assertRaises(ValueError):
                 data = cli_utils.kwarg(string)
 
+    def test_kwargs_error_messages(self):
+
+        cases = [
+            ('true', "not in value"),
+            (' =world', "starts with separator"),
+            ('more= ', "ends with separator"),
+            ('a=b=', "ends with separator"),
+            ('a=b=c', "only have one"),
+        ]
+        for string, message in cases:
+            with self.assertRaises(ValueError) as context:
+                cli_utils.kwarg(string)
+            self.assertIn(message, str(context.exception))
+
+    def test_kwargs_overlapping_separator(self):
+
+        self.assertEqual(cli_utils.kwarg('a===b', '=='), {'a': '=b'})
+        cases = [
+            ('a===', "ends with separator"),
+            ('===a', "starts with separator"),
+            ('a====b', "only have one"),
+        ]
+        for string, message in cases:
+            with self.assertRaises(ValueError) as context:
+                cli_utils.kwarg(string, '==')
+            self.assertIn(message, str(context.exception))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,6 +22,7 @@ import copy
 import errno
 import os
 import shlex
+import shutil
 import sys
 import tempfile
 import textwrap
@@ -33,6 +34,46 @@ import six
 from simpl import config
 from simpl import exceptions as simpl_exceptions
 
+EXPECTED_PAIRS = {'A': '1', 'B': '2', 'C': '3'}
+
+EXPECTED_HELP = textwrap.dedent("""\
+    usage: test [-h] [--ini PATH] [--host HOST]
+
+    optional arguments:
+      -h, --help   show this help message and exit
+      --host HOST  Server address. (default: 127.0.0.1)
+
+    initialization (metaconfig) arguments:
+      evaluated first and can be used to source an entire config
+
+      --ini PATH   Source some or all of the options from this ini file.
+    """)
+
+INI_METACONF = textwrap.dedent(
+    """
+    [default]
+    ham = glam
+    grand = slam
+
+    [program]
+    spam = rico
+    grand = notpreferred
+    """
+)
+
+INI_METACONF_UNKNOWN = textwrap.dedent(
+    """
+    [default]
+    ham = glam
+    grand = slam
+    notanoption = toobad
+
+    [program]
+    spam = rico
+    grand = notpreferred
+    """
+)
+
 
 class TestConverters(unittest.TestCase):
 
@@ -41,12 +82,11 @@ class TestConverters(unittest.TestCase):
     def test_comma_separated_strings(self):
         expected = ['1', '2', '3']
         result = config.comma_separated_strings("1,2,3")
-        six.assertCountEqual(self, result, expected)
+        self.assertEqual(result, expected)
 
     def test_format_comma_separated_pairs(self):
-        expected = dict(A='1', B='2', C='3')
         result = config.comma_separated_pairs("A=1,B=2,C=3")
-        self.assertEqual(result, expected)
+        self.assertEqual(result, EXPECTED_PAIRS)
 
     def test_read_from(self):
         # TODO(zns): need to add this test
@@ -116,10 +156,33 @@ class TestParsers(unittest.TestCase):
 
 class TestConfig(unittest.TestCase):
 
-    def get_tempfile(self, *args, **kwargs):
-        fp = tempfile.NamedTemporaryFile(*args, **kwargs)
-        self.addCleanup(fp.close)
-        return fp
+    @classmethod
+    def setUpClass(cls):
+        cls.tempdir = tempfile.mkdtemp(prefix='simpl-test-config-')
+        # shared by the group tests that only inspect the parser
+        opts = [
+            config.Option('--baz'),
+            config.Option('--password', group='secret'),
+            config.Option('--key', group='secret',
+                          group_description='haha security'),
+            config.Option('--this', group='things'),
+            config.Option('--that', group='things',
+                          group_description='define me once'),
+            config.Option('--other', group='things'),
+            config.Option('--who', group='group of its own'),
+        ]
+        cls.group_parser = config.Config(options=opts).build_parser(opts)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tempdir)
+
+    def write_tempfile(self, data):
+        """Write data to a new file in the class tempdir."""
+        fd, path = tempfile.mkstemp(dir=self.tempdir)
+        os.write(fd, data.encode('utf-8'))
+        os.close(fd)
+        return path
 
     def test_copies(self):
         cfg = config.Config(options=[
@@ -129,6 +192,9 @@ class TestConfig(unittest.TestCase):
         ])
         another = copy.copy(cfg)
         self.assertEqual(cfg, another)
+        another['one'] = 2
+        self.assertEqual(cfg['one'], 1)
+        self.assertIsNot(cfg._parser_cache, another._parser_cache)
 
     def test_instantiation(self):
         empty = config.Config(options=[])
@@ -187,6 +253,20 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(cfg.one, 1)
         self.assertEqual(cfg.two, '2')
 
+    def test_parsers_cached_until_options_change(self):
+        cfg = config.Config(options=[
+            config.Option('--one', default=1),
+        ])
+        cfg.parse(['prog', '--one', '2'])
+        cached = dict(cfg._parser_cache)
+        cfg.parse(['prog', '--one', '3'])
+        self.assertEqual(cfg.one, '3')
+        self.assertEqual(cached, cfg._parser_cache)
+        cfg._options.append(config.Option('--two', default=2))
+        cfg.parse(['prog', '--two', '4'])
+        self.assertEqual(cfg.two, '4')
+        self.assertNotEqual(cached['cli'], cfg._parser_cache['cli'])
+
     def test_required_negative(self):
         cfg = config.Config(options=[
             config.Option('--required', required=True),
@@ -195,6 +275,7 @@ class TestConfig(unittest.TestCase):
             cfg.parse([])
 
     def test_argparser_groups(self):
+        # groups without any group_description
         opts = [
             config.Option('--baz'),
             config.Option('--password', group='secret'),
@@ -204,18 +285,11 @@ class TestConfig(unittest.TestCase):
             config.Option('--other', group='things'),
             config.Option('--who', group='group of its own'),
         ]
-        myconf = config.Config(options=opts)
-        parser = myconf.build_parser(opts)
-        secret_group = None
-        things_group = None
-        own_group = None
-        for grp in parser._action_groups:
-            if grp.title == 'secret':
-                secret_group = grp
-            elif grp.title == 'things':
-                things_group = grp
-            elif grp.title == 'group of its own':
-                own_group = grp
+        parser = config.Config(options=opts).build_parser(opts)
+        groups = {grp.title: grp for grp in parser._action_groups}
+        secret_group = groups.get('secret')
+        things_group = groups.get('things')
+        own_group = groups.get('group of its own')
         self.assertTrue(secret_group)
         self.assertTrue(things_group)
         self.assertTrue(own_group)
@@ -237,19 +311,7 @@ class TestConfig(unittest.TestCase):
         self.assertIn('--who', option_strings)
 
     def test_group_help_usage_output(self):
-        opts = [
-            config.Option('--baz'),
-            config.Option('--password', group='secret'),
-            config.Option('--key', group='secret',
-                          group_description='haha security'),
-            config.Option('--this', group='things'),
-            config.Option('--that', group='things',
-                          group_description='define me once'),
-            config.Option('--other', group='things'),
-            config.Option('--who', group='group of its own'),
-        ]
-        myconf = config.Config(options=opts)
-        parser = myconf.build_parser(opts)
+        parser = self.group_parser
         helplines = [k.strip() for k in parser.format_help().splitlines()]
         self.assertIn('secret:', helplines)
         self.assertIn('haha security', helplines)
@@ -269,12 +331,10 @@ class TestConfig(unittest.TestCase):
 
         # for read_from
         keystring = 'this-is-a-private-key'
-        strfile = self.get_tempfile()
-        strfile.write(('%s-written-to-file' % keystring).encode('utf-8'))
-        strfile.flush()
+        strfile = self.write_tempfile('%s-written-to-file' % keystring)
 
         myconf = config.Config(options=opts)
-        argv = ['program', '--key-file', strfile.name,
+        argv = ['program', '--key-file', strfile,
                 '--key', keystring]
 
         with self.assertRaises(SystemExit):
@@ -303,15 +363,13 @@ class TestConfig(unittest.TestCase):
 
         # for read_from
         keystring = 'this-is-a-private-key'
-        strfile = self.get_tempfile()
-        strfile.write(('%s-written-to-file' % keystring).encode('utf-8'))
-        strfile.flush()
+        strfile = self.write_tempfile('%s-written-to-file' % keystring)
 
         myconf = config.Config(options=opts)
         argv = ['program', '--key', keystring]
         myconf.parse(argv=argv)
         self.assertEqual(myconf.key, keystring)
-        argv = ['program', '--key-file', strfile.name]
+        argv = ['program', '--key-file', strfile]
         myconf.parse(argv=argv)
         self.assertEqual(myconf.key, '%s-written-to-file' % keystring)
 
@@ -404,26 +462,13 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(metaconf.options[0].args, ('--ini',))
 
     def test_metaconfig_ini(self):
-        metaconf = textwrap.dedent(
-            """
-            [default]
-            ham = glam
-            grand = slam
-
-            [program]
-            spam = rico
-            grand = notpreferred
-            """
-        )
         opts = [
             config.Option('--ham', ini_section='default'),
             config.Option('--grand', ini_section='default'),
             config.Option('--spam'),
         ]
-        strfile = self.get_tempfile()
-        strfile.write(metaconf.encode('utf-8'))
-        strfile.flush()
-        argv = ['program', '--ini', strfile.name]
+        strfile = self.write_tempfile(INI_METACONF)
+        argv = ['program', '--ini', strfile]
         myconf = config.Config(options=opts, argv=argv, prog='program')
         myconf.parse()
         self.assertEqual(myconf.grand, 'slam')
@@ -432,27 +477,13 @@ class TestConfig(unittest.TestCase):
 
     def test_metaconfig_ini_nooption_raises(self):
         """Test that ini options with no matches raises an error."""
-        metaconf = textwrap.dedent(
-            """
-            [default]
-            ham = glam
-            grand = slam
-            notanoption = toobad
-
-            [program]
-            spam = rico
-            grand = notpreferred
-            """
-        )
         opts = [
             config.Option('--ham', ini_section='default'),
             config.Option('--grand', ini_section='default'),
             config.Option('--spam'),
         ]
-        strfile = self.get_tempfile()
-        strfile.write(metaconf.encode('utf-8'))
-        strfile.flush()
-        argv = ['program', '--ini', strfile.name]
+        strfile = self.write_tempfile(INI_METACONF_UNKNOWN)
+        argv = ['program', '--ini', strfile]
         myconf = config.Config(options=opts, argv=argv, prog='program')
         expected_error = simpl_exceptions.SimplConfigUnknownOption
         expected_message = ("No corresponding Option was found for the "
@@ -497,25 +528,15 @@ class TestConfig(unittest.TestCase):
             conf.parse(argv=['test.py', '-h'])
         except SystemExit:
             pass
-        expected = textwrap.dedent("""\
-        usage: test [-h] [--ini PATH] [--host HOST]
-
-        optional arguments:
-          -h, --help   show this help message and exit
-          --host HOST  Server address. (default: 127.0.0.1)
-
-        initialization (metaconfig) arguments:
-          evaluated first and can be used to source an entire config
-
-          --ini PATH   Source some or all of the options from this ini file.
-        """)
-        self.assertEqual(mock_stdout.getvalue(), expected)
+        self.assertEqual(mock_stdout.getvalue(), EXPECTED_HELP)
 
 
 class TestConfigPrecedence(unittest.TestCase):
 
-    def setUp(self):
-        self.opts = [
+    @classmethod
+    def setUpClass(cls):
+        # every case parses from scratch, so one Config can be shared
+        cls.opts = [
             config.Option(
                 '--foo',
                 required=True,
@@ -530,8 +551,8 @@ class TestConfigPrecedence(unittest.TestCase):
             ),
         ]
 
-        self.conf = config.Config(
-            options=self.opts,
+        cls.conf = config.Config(
+            options=cls.opts,
             prog='test',
         )
 
@@ -34,33 +34,77 @@ class TestDB(mongodb.SimplDB):
         pass  # bypass async tuning in tests
 
 
+# Sandboxed mongodb instance shared by every test in this module
+_BOX = None
+
+
+def setUpModule():
+    """Fire up a sandboxed mongodb instance."""
+    global _BOX  # pylint: disable=W0603
+    # Enable text search if testing on 2.4
+    mongobox.mongobox.DEFAULT_ARGS.extend(
+        ['--setParameter', 'textSearchEnabled=true'])
+    _BOX = mongobox.MongoBox()
+    _BOX.start()
+
+
+def tearDownModule():
+    """Stop the sanboxed mongodb instance."""
+    global _BOX  # pylint: disable=W0603
+    if isinstance(_BOX, mongobox.MongoBox) and _BOX.running() is True:
+        _BOX.stop()
+    _BOX = None
+
+
 class TestMongoDB(unittest.TestCase):
 
     """Test :mod:`simpl.db.mongodb`."""
 
     @classmethod
     def setUpClass(cls):
-        """Fire up a sandboxed mongodb instance."""
-        # Enable text search if testing on 2.4
-        mongobox.mongobox.DEFAULT_ARGS.extend(
-            ['--setParameter', 'textSearchEnabled=true'])
-        cls.box = mongobox.MongoBox()
-        cls.box.start()
+        """Connect once to our sandboxed mongodb instance."""
+        cls.box = _BOX
+        cls.db = None
+        if cls.box is not None:
+            cls.db = TestDB("mongodb://127.0.0.1:%s/test" % cls.box.port)
+            cls.db.create_index(
+                'prose',
+                [("name", pymongo.TEXT),
+                 ("keywords", pymongo.TEXT)],
+                background=False,
+                name="idx_a",
+                default_language="none")  # include stop words like "Do"
+            cls.db.create_index('prose', "name", background=False,
+                                name="idx_b")
 
     @classmethod
     def tearDownClass(cls):
-        """Stop the sanboxed mongodb instance."""
-        if hasattr(cls, 'box') and isinstance(cls.box, mongobox.MongoBox):
-            if cls.box.running() is True:
-                cls.box.stop()
-                cls.box = None
+        """Drop the shared connection."""
+        cls.db = None
 
     def setUp(self):
-        """Get a client conection to our sandboxed mongodb instance."""
-        if hasattr(self, 'box'):
-            self.db = TestDB("mongodb://127.0.0.1:%s/test" % self.box.port)
-        else:
+        """Start each test with empty collections.
+
+        Documents are removed rather than the collections dropped so that
+        the indexes built in setUpClass survive between tests.
+        """
+        if self.db is None:
             self.fail("No sandboxed MongoDB")
+        for name in TestDB.__collections__:
+            self.db.connection[name].remove({})
+
+    def _bulk_save(self, collection, items):
+        """Write (key, document) pairs to a collection in one batch.
+
+        This bypasses :meth:`mongodb.Collection.save`, so only use it to
+        seed fixtures for tests that are not testing writes.
+        """
+        docs = []
+        for key, data in items:
+            doc = data.copy()
+            doc['_id'] = key
+            docs.append(doc)
+        self.db.connection[collection].insert(docs, manipulate=True)
 
     def test_write_read(self):
         self.db.widgets.save("A", {"name": "test A"})
@@ -132,19 +176,12 @@ class TestMongoDB(unittest.TestCase):
         self.assertFalse(db1 is db3)
 
     def test_text_search(self):
-        self.db.create_index(
-            'prose',
-            [("name", pymongo.TEXT),
-             ("keywords", pymongo.TEXT)],
-            background=False,
-            name="idx_a",
-            default_language="none")  # include stop words like "Do"
-        self.db.create_index('prose', "name", background=False, name="idx_b")
-
-        self.db.prose.save("A", {"name": "John Adams",
-                                 "keywords": "economics wealth nations"})
-        self.db.prose.save("B", {"name": "Johnny Walker",
-                                 "keywords": "whisky health"})
+        self._bulk_save('prose', [
+            ("A", {"name": "John Adams",
+                   "keywords": "economics wealth nations"}),
+            ("B", {"name": "Johnny Walker",
+                   "keywords": "whisky health"}),
+        ])
         # Single word
         search = mongodb.build_text_search(['john'])
         result = self.db.prose.list(**search)
@@ -215,30 +252,25 @@ class TestMongoDBCapabilities(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Fire up a sandboxed mongodb instance."""
-        cls.box = mongobox.MongoBox()
-        cls.box.start()
+        """Get a client conection to our sandboxed mongodb instance."""
+        cls.client = None
+        if _BOX is not None:
+            cls.client = _BOX.client()
+            # tests share this collection, each with its own document _id
+            cls.docs = cls.client.tdb.docs
 
     @classmethod
     def tearDownClass(cls):
-        """Stop the sanboxed mongodb instance."""
-        if hasattr(cls, 'box') and isinstance(cls.box, mongobox.MongoBox):
-            if cls.box.running() is True:
-                cls.box.stop()
-                cls.box = None
+        """Disconnect the client."""
+        if cls.client is not None:
+            cls.client.close()
+            cls.client = None
 
     def setUp(self):
-        """Get a client conection to our sandboxed mongodb instance."""
-        if hasattr(self, 'box'):
-            self.client = self.box.client()
-        else:
+        """Make sure the shared client is connected."""
+        if self.client is None:
             self.fail("No sandboxed MongoDB")
 
-    def tearDown(self):
-        """Disconnect the client."""
-        if hasattr(self, 'box'):
-            self.client = None
-
     def test_mongo_instance(self):
         """Verify the mongobox's mongodb instance is working."""
         self.assertTrue(self.client.server_info())
@@ -265,10 +297,10 @@ class TestMongoDBCapabilities(unittest.TestCase):
 
     def test_mongo_projection(self):
         """We can return our IDs with only specific fields."""
-        col = self.client.tdb.c3
-        col.save({'id': 'our-id', 'name': 'Ziad', 'hide': 'X'})
-        result = col.find_one(
-            {'id': 'our-id'},
+        self.docs.insert({'_id': 'projection', 'id': 'our-id', 'name': 'Ziad',
+                          'hide': 'X'})
+        result = self.docs.find_one(
+            {'_id': 'projection'},
             {
                 '_id': 0,
                 'hide': 0
@@ -278,40 +310,30 @@ class TestMongoDBCapabilities(unittest.TestCase):
 
     def test_partial_update(self):
         """We can update only specific fields."""
-        col = self.client.tdb.c4
-        col.save({'id': 'our-id', 'status': 'PLANNED', 'name': 'Ziad'})
-        obj = col.find_one({'id': 'our-id'}, {'_id': 0})
+        self.docs.insert({'_id': 'partial', 'id': 'our-id',
+                          'status': 'PLANNED', 'name': 'Ziad'})
+        obj = self.docs.find_one({'_id': 'partial'}, {'_id': 0})
         self.assertIn('name', obj, msg="'name' was not saved")
 
-        col.update(
-            {'id': 'our-id'},
+        self.docs.update(
+            {'_id': 'partial'},
             {
                 '$set': {
                     'status': 'UP'
                 }
             }
         )
-        obj = col.find_one({'id': 'our-id'}, {'_id': 0})
+        obj = self.docs.find_one({'_id': 'partial'}, {'_id': 0})
         self.assertIn('name', obj, msg="'name' was removed by an update")
         self.assertDictEqual(obj, {'id': 'our-id', 'status': 'UP',
                                    'name': 'Ziad'})
 
     def test_deep_partial_unsupported(self):
         """Mongo update is like a dict.update() - it overwrites whole keys."""
-        col = self.client.tdb.c5
-        col.save(
-            {
-                'id': 'our-id',
-                'status': 'PLANNED',
-                'subobj': {
-                    'name': 'Ziad',
-                    'status': 'busy',
-                }
-            }
-        )
-
-        col.update(
-            {'id': 'our-id'},
+        self.docs.insert({'_id': 'deep', 'id': 'our-id', 'status': 'PLANNED',
+                          'subobj': {'name': 'Ziad', 'status': 'busy'}})
+        self.docs.update(
+            {'_id': 'deep'},
             {
                 '$set': {
                     'status': 'UP',
@@ -321,7 +343,7 @@ class TestMongoDBCapabilities(unittest.TestCase):
                 }
             }
         )
-        obj = col.find_one({'id': 'our-id'}, {'_id': 0})
+        obj = self.docs.find_one({'_id': 'deep'}, {'_id': 0})
         self.assertIn('id', obj, msg="'id' was removed by an update")
         self.assertIn('subobj', obj, msg="'subobj' was removed by an update")
         subobj = obj['subobj']
@@ -336,15 +358,10 @@ class TestMongoDBCapabilities(unittest.TestCase):
 
     def test_write_if_zero(self):
         """Verify that syntax for locking an object works."""
-        col = self.client.tdb.c6
-        col.save(
-            {
-                'id': 'our-id',
-                '_lock': 0
-            }
-        )
-        obj = col.find_and_modify(
+        self.docs.insert({'_id': 'lock-zero', 'id': 'our-id', '_lock': 0})
+        obj = self.docs.find_and_modify(
             query={
+                '_id': 'lock-zero',
                 '$or': [{'_lock': {'$exists': False}}, {'_lock': 0}]
             },
             update={
@@ -358,14 +375,10 @@ class TestMongoDBCapabilities(unittest.TestCase):
 
     def test_write_if_field_not_exists(self):
         """Verify that syntax for locking an object works."""
-        col = self.client.tdb.c7
-        col.save(
-            {
-                'id': 'our-id',
-            }
-        )
-        obj = col.find_and_modify(
+        self.docs.insert({'_id': 'lock-missing', 'id': 'our-id'})
+        obj = self.docs.find_and_modify(
             query={
+                '_id': 'lock-missing',
                 '$or': [{'_lock': {'$exists': False}}, {'_lock': 0}]
             },
             update={
@@ -379,15 +392,11 @@ class TestMongoDBCapabilities(unittest.TestCase):
 
     def test_skip_if_filtered(self):
         """Verify that syntax for locking an object works."""
-        col = self.client.tdb.c8
-        col.save(
-            {
-                'id': 'our-id',
-                '_lock': 'my-key'
-            }
-        )
-        obj = col.find_and_modify(
+        self.docs.insert({'_id': 'lock-taken', 'id': 'our-id',
+                          '_lock': 'my-key'})
+        obj = self.docs.find_and_modify(
             query={
+                '_id': 'lock-taken',
                 '$or': [{'_lock': {'$exists': False}}, {'_lock': 0}]
             },
             update={
@@ -14,7 +14,6 @@
 
 """Tests for :mod:`dicts`"""
 
-import copy
 import re
 import unittest
 
@@ -28,6 +27,10 @@ class TestSplitMergeDicts(unittest.TestCase):
 
     """Tests for split/merge dicts in :mod:`dicts`."""
 
+    SECRET_KEYS = ("secret_value", re.compile("password"),
+                    re.compile(r"priv(?:ate)?[-_ ]?key$"))
+    QUUX_KEYS = (re.compile('quux'),)
+
     def test_split_dict_simple(self):
         fxn = dicts.split_dict
         self.assertEqual(fxn({}), ({}, None))
@@ -43,14 +46,15 @@ class TestSplitMergeDicts(unittest.TestCase):
         self.assertDictEqual(combined, original)
 
     def test_split_dict_works_with_None_keys(self):
-        filter_keys = [re.compile('quux')]
         data = {None: 'foobar'}
         expected = (data, None)
         self.assertEqual(expected,
-                         dicts.split_dict(data, filter_keys))
+                         dicts.split_dict(data, self.QUUX_KEYS))
 
-    def test_extract_data_expression_as_filter(self):
-        data = {
+    @staticmethod
+    def _make_data():
+        """Build a new nested dict of employee and server data."""
+        return {
             "employee": {
                 "name": "Bob",
                 "title": "Mr.",
@@ -73,6 +77,9 @@ class TestSplitMergeDicts(unittest.TestCase):
             "secret_value": "Immasecret"
         }
 
+    def test_extract_data_expression_as_filter(self):
+        data = self._make_data()
+
         safe = {
             "employee": {
                 "name": "Bob",
@@ -105,10 +112,8 @@ class TestSplitMergeDicts(unittest.TestCase):
             "secret_value": "Immasecret"
         }
 
-        original_dict = copy.deepcopy(data)
-        secret_keys = ["secret_value", re.compile("password"),
-                       re.compile("priv(?:ate)?[-_ ]?key$")]
-        body, hidden = dicts.split_dict(data, secret_keys)
+        original_dict = self._make_data()
+        body, hidden = dicts.split_dict(data, self.SECRET_KEYS)
         self.assertDictEqual(body, safe)
         self.assertDictEqual(secret, hidden)
         dicts.merge_dictionary(body, hidden)
@@ -289,152 +294,61 @@ class TestDictPaths(unittest.TestCase):
 
     """Tests for :mod:`dicts` functions using paths as keys."""
 
+    # (name, start factory, path, value, expected); write_path modifies its
+    # input, so each run gets a fresh start dict from the factory.
+    WRITE_CASES = (
+        ('scalar at root', dict, 'root', 'scalar', {'root': 'scalar'}),
+        ('int at root', dict, 'root', 10, {'root': 10}),
+        ('bool at root', dict, 'root', True, {'root': True}),
+        ('value at two piece path', dict, 'root/subfolder', True,
+         {'root': {'subfolder': True}}),
+        ('value at multi piece path', dict, 'one/two/three', {},
+         {'one': {'two': {'three': {}}}}),
+        ('add to existing', lambda: {'root': {'exists': True}}, 'root/new',
+         False, {'root': {'exists': True, 'new': False}}),
+        ('overwrite existing', lambda: {'root': {'exists': True}},
+         'root/exists', False, {'root': {'exists': False}}),
+    )
+
+    # (name, start, path, expected)
+    READ_CASES = (
+        ('simple value', {'root': 1}, 'root', 1),
+        ('simple path', {'root': {'folder': 2}}, 'root/folder', 2),
+        ('blank path', {'root': 1}, '', None),
+        ('/ only', {'root': 1}, '/', None),
+        ('extra /', {'root': 1}, '/root/', 1),
+        ('nonexistent root', {'root': 1}, 'not-there', None),
+        ('nonexistent path', {'root': 1}, 'root/not/there', None),
+        ('empty source', {}, 'root', None),
+    )
+
+    # (name, start, path, expected)
+    EXISTS_CASES = (
+        ('simple value', {'root': 1}, 'root', True),
+        ('simple path', {'root': {'folder': 2}}, 'root/folder', True),
+        ('blank path', {'root': 1}, '', False),
+        ('/ only', {'root': 1}, '/', True),
+        ('extra /', {'root': 1}, '/root/', True),
+        ('nonexistent root', {'root': 1}, 'not-there', False),
+        ('nonexistent path', {'root': 1}, 'root/not-there', False),
+        ('empty source', {}, 'root', False),
+    )
+
     def test_write_path(self):
-        cases = [
-            {
-                'name': 'scalar at root',
-                'start': {},
-                'path': 'root',
-                'value': 'scalar',
-                'expected': {'root': 'scalar'}
-            }, {
-                'name': 'int at root',
-                'start': {},
-                'path': 'root',
-                'value': 10,
-                'expected': {'root': 10}
-            }, {
-                'name': 'bool at root',
-                'start': {},
-                'path': 'root',
-                'value': True,
-                'expected': {'root': True}
-            }, {
-                'name': 'value at two piece path',
-                'start': {},
-                'path': 'root/subfolder',
-                'value': True,
-                'expected': {'root': {'subfolder': True}}
-            }, {
-                'name': 'value at multi piece path',
-                'start': {},
-                'path': 'one/two/three',
-                'value': {},
-                'expected': {'one': {'two': {'three': {}}}}
-            }, {
-                'name': 'add to existing',
-                'start': {'root': {'exists': True}},
-                'path': 'root/new',
-                'value': False,
-                'expected': {'root': {'exists': True, 'new': False}}
-            }, {
-                'name': 'overwrite existing',
-                'start': {'root': {'exists': True}},
-                'path': 'root/exists',
-                'value': False,
-                'expected': {'root': {'exists': False}}
-            }
-        ]
-        for case in cases:
-            result = case['start']
-            dicts.write_path(result, case['path'], case['value'])
-            self.assertEqual(result, case['expected'], msg=case['name'])
+        for name, make_start, path, value, expected in self.WRITE_CASES:
+            result = make_start()
+            dicts.write_path(result, path, value)
+            self.assertEqual(result, expected, msg=name)
 
     def test_read_path(self):
-        cases = [
-            {
-                'name': 'simple value',
-                'start': {'root': 1},
-                'path': 'root',
-                'expected': 1
-            }, {
-                'name': 'simple path',
-                'start': {'root': {'folder': 2}},
-                'path': 'root/folder',
-                'expected': 2
-            }, {
-                'name': 'blank path',
-                'start': {'root': 1},
-                'path': '',
-                'expected': None
-            }, {
-                'name': '/ only',
-                'start': {'root': 1},
-                'path': '/',
-                'expected': None
-            }, {
-                'name': 'extra /',
-                'start': {'root': 1},
-                'path': '/root/',
-                'expected': 1
-            }, {
-                'name': 'nonexistent root',
-                'start': {'root': 1},
-                'path': 'not-there',
-                'expected': None
-            }, {
-                'name': 'nonexistent path',
-                'start': {'root': 1},
-                'path': 'root/not/there',
-                'expected': None
-            }, {
-                'name': 'empty source',
-                'start': {},
-                'path': 'root',
-                'expected': None
-            },
-        ]
-        for case in cases:
-            result = dicts.read_path(case['start'], case['path'])
-            self.assertEqual(result, case['expected'], msg=case['name'])
+        for name, start, path, expected in self.READ_CASES:
+            result = dicts.read_path(start, path)
+            self.assertEqual(result, expected, msg=name)
 
     def test_path_exists(self):
-        cases = [
-            {
-                'name': 'simple value',
-                'start': {'root': 1},
-                'path': 'root',
-                'expected': True
-            }, {
-                'name': 'simple path',
-                'start': {'root': {'folder': 2}},
-                'path': 'root/folder',
-                'expected': True
-            }, {
-                'name': 'blank path',
-                'start': {'root': 1},
-                'path': '',
-                'expected': False
-            }, {
-                'name': '/ only',
-                'start': {'root': 1},
-                'path': '/',
-                'expected': True
-            }, {
-                'name': 'extra /',
-                'start': {'root': 1},
-                'path': '/root/',
-                'expected': True
-            }, {
-                'name': 'nonexistent root',
-                'start': {'root': 1},
-                'path': 'not-there',
-                'expected': False
-            }, {
-                'name': 'nonexistent path',
-                'start': {'root': 1},
-                'path': 'root/not-there',
-                'expected': False
-            }, {
-                'name': 'empty source',
-                'start': {},
-                'path': 'root',
-                'expected': False
-            },
-        ]
-        for case in cases:
-            result = dicts.path_exists(case['start'], case['path'])
-            self.assertEqual(result, case['expected'], msg=case['name'])
+        for name, start, path, expected in self.EXISTS_CASES:
+            result = dicts.path_exists(start, path)
+            self.assertEqual(result, expected, msg=name)
 
 if __name__ == '__main__':
     unittest.main()
@@ -37,19 +37,42 @@ def _configure_test_user(gitrepo):
     gitrepo.run_command('git config --local user.email %s' % email)
 
 
+def _tempdir_prefix():
+
+    return "%s-" % '-'.join(__file__.split(os.sep)[-3:])
+
+
 class TestGitBase(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Set up one initialized repo per class; new_repo() copies it
+        # instead of running `git init`, config and commit every time.
+        cls.template_dir = tempfile.mkdtemp(prefix=_tempdir_prefix())
+        template = git.GitRepo.init(cls.template_dir)
+        _configure_test_user(template)
+        template.commit(message='Initial commit', stage=False, amend=False)
+        # Copies read refs from one packed-refs file instead of refs/
+        template.run_command(['git', 'pack-refs', '--all'])
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.template_dir)
+
     def new_repo(self):
         tmpd = self.create_tempdir()
-        repo = git.GitRepo.init(tmpd)
-        _configure_test_user(repo)
-        repo.commit(message='Initial commit', stage=False, amend=False)
-        _configure_test_user(repo)
-        return repo
+        shutil.copytree(os.path.join(self.template_dir, '.git'),
+                        os.path.join(tmpd, '.git'))
+        return git.GitRepo(tmpd)
+
+    def create_tempfile(self, repo, suffix='.simpltest'):
+        fd, path = tempfile.mkstemp(dir=repo.repo_dir, suffix=suffix)
+        os.write(fd, b"calmer than you are")
+        os.close(fd)
+        return path
 
     def create_tempdir(self):
-        prefix = "%s-" % '-'.join(__file__.split(os.sep)[-3:])
-        new = tempfile.mkdtemp(prefix=prefix)
+        new = tempfile.mkdtemp(prefix=_tempdir_prefix())
         self.tempdirs.append(new)
         return new
 
@@ -100,12 +123,12 @@ class TestGitRepo(TestGitBase):
 
     def test_origin_property(self):
         gr = self.new_repo()
-        clone = git.GitRepo.clone(gr.repo_dir, temp=True)
+        clone = git.GitRepo.clone(gr.repo_dir, temp=True, hardlinks=True)
         self.assertEqual(clone.origin, gr.repo_dir)
 
     def test_gitrepo_clone_temp(self):
         gr = self.new_repo()
-        clone = git.GitRepo.clone(gr.repo_dir, temp=True)
+        clone = git.GitRepo.clone(gr.repo_dir, temp=True, hardlinks=True)
         self.assertTrue(clone.temp)
         self.assertIn(tempfile.gettempdir(), clone.repo_dir)
 
@@ -121,6 +144,13 @@ class TestGitRepo(TestGitBase):
         msg = "cloning into '%s'" % repo_c_path.lower()
         self.assertIn(msg, output.lower())
 
+    def test_clone_copies_local_objects_by_default(self):
+        with mock.patch.object(git, 'execute_git_command') as execute:
+            git.git_clone('target', self.repo.repo_dir)
+            self.assertIn('--no-hardlinks', execute.call_args[0][0])
+            git.git_clone('target', self.repo.repo_dir, hardlinks=True)
+            self.assertNotIn('--no-hardlinks', execute.call_args[0][0])
+
     def test_list_config(self):
         gr = self.new_repo()
         cfg = gr.list_config()
@@ -171,7 +201,8 @@ class TestGitRepo(TestGitBase):
         feature_revision = self.repo.head
         # now go checkout something else...
         self.repo.checkout('master')
-        nextrepo = git.GitRepo.clone(self.repo.repo_dir, temp=True)
+        nextrepo = git.GitRepo.clone(self.repo.repo_dir, temp=True,
+                                     hardlinks=True)
         _configure_test_user(nextrepo)
         self.assertEqual(nextrepo.current_branch, 'master')
         self.assertNotEqual(nextrepo.head, feature_revision)
@@ -185,7 +216,8 @@ class TestGitRepo(TestGitBase):
     def test_ls_remote(self):
         initial_hash = self.repo.head
         initial_ref = self.repo.current_branch
-        nextrepo = git.GitRepo.clone(self.repo.repo_dir, temp=True)
+        nextrepo = git.GitRepo.clone(self.repo.repo_dir, temp=True,
+                                     hardlinks=True)
         _configure_test_user(nextrepo)
         ls_remotes = nextrepo.ls_remote(refs=initial_ref)
         master_hash = ls_remotes['refs/heads/master']
@@ -211,7 +243,8 @@ class TestGitRepo(TestGitBase):
     def test_changing_remote_resolve_branch_reference(self):
         initial_hash = self.repo.head
         initial_ref = self.repo.current_branch
-        nextrepo = git.GitRepo.clone(self.repo.repo_dir, temp=True)
+        nextrepo = git.GitRepo.clone(self.repo.repo_dir, temp=True,
+                                     hardlinks=True)
         _configure_test_user(nextrepo)
         master_hash = nextrepo.remote_resolve_reference(initial_ref)
         self.assertEqual(master_hash, initial_hash)
@@ -238,19 +271,19 @@ class TestGitRepo(TestGitBase):
         self.assertEqual(rpr, expected)
 
     def test_remote_resolve_fails(self):
-        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True)
+        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True, hardlinks=True)
         revision = gr.remote_resolve_reference('notreal')
         self.assertIsNone(revision)
 
     def test_remote_resolve_tag_reference(self):
         tagname = 'lizard'
         self.repo.tag(tagname)
-        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True)
+        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True, hardlinks=True)
         revision = gr.remote_resolve_reference(tagname)
         self.assertEqual(self.repo.head, revision)
 
     def test_changing_remote_resolve_tag_reference(self):
-        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True)
+        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True, hardlinks=True)
         self.repo.commit(message='change the hash')
         tagname = 'lizard'
         self.repo.tag(tagname)
@@ -275,7 +308,8 @@ class TestGitRepo(TestGitBase):
         self.repo.branch(cloned_branch)
 
         repo_c_path = self.create_tempdir()
-        repo_c = git.GitRepo.clone(self.repo.repo_dir, repo_c_path)
+        repo_c = git.GitRepo.clone(self.repo.repo_dir, repo_c_path,
+                                   hardlinks=True)
 
         branch_list = repo_c.list_branches()
         branchnames = [b['branch'] for b in branch_list]
@@ -307,7 +341,7 @@ class TestGitRepo(TestGitBase):
 
     def test_list_remotes(self):
 
-        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True)
+        gr = git.GitRepo.clone(self.repo.repo_dir, temp=True, hardlinks=True)
         remotes = gr.list_remotes()
         expected = {
             'cmd': '(fetch)',
@@ -340,7 +374,8 @@ class TestGitRepo(TestGitBase):
         self.repo.tag(cloned_tag)
 
         repo_c_path = self.create_tempdir()
-        repo_c = git.GitRepo.clone(self.repo.repo_dir, repo_c_path)
+        repo_c = git.GitRepo.clone(self.repo.repo_dir, repo_c_path,
+                                   hardlinks=True)
 
         tag_list = repo_c.list_tags()
         self.assertIn(cloned_tag, tag_list)
@@ -379,10 +414,7 @@ class TestGitRepo(TestGitBase):
         self.assertTrue(self.repo.commit(amend=True))
 
     def test_commit_automatically_stages(self):
-        temp = tempfile.NamedTemporaryFile(
-            dir=self.repo.repo_dir, suffix='.simpltest')
-        temp.write("calmer than you are".encode('utf-8'))
-        temp.flush()
+        self.create_tempfile(self.repo)
         msg = "1 file changed"
         output = self.repo.commit(message="dudeism")
         self.assertIn(msg.lower(), output.lower())
@@ -398,9 +430,7 @@ class TestGitRepo(TestGitBase):
         hash_before = self.repo.head
         self.repo.tag('tag_before_changes')
 
-        temp = tempfile.NamedTemporaryFile(
-            dir=self.repo.repo_dir, suffix='.simpltest')
-        temp.file.write("calmer than you are".encode('utf-8'))
+        self.create_tempfile(self.repo)
         self.repo.commit(message="dudeism")
         hash_after = self.repo.head
         self.repo.tag('tag_after_changes')
@@ -413,9 +443,7 @@ class TestGitRepo(TestGitBase):
     def test_checkout_dash_b(self):
         hash_before = self.repo.head
         self.repo.tag('tag_before_changes')
-        temp = tempfile.NamedTemporaryFile(
-            dir=self.repo.repo_dir, suffix='.simpltest')
-        temp.file.write("calmer than you are".encode('utf-8'))
+        self.create_tempfile(self.repo)
         self.repo.commit(message="dudeism")
         hash_after = self.repo.head
         self.repo.tag('tag_after_changes')
@@ -89,6 +89,23 @@ class TestEventletLogger(unittest.TestCase):
         access_log.write.assert_called_once_with(entry + "\n")
 
 
+class TestFmtPairs(unittest.TestCase):
+
+    def test_empty(self):
+        self.assertEqual(server.fmt_pairs([]), '')
+
+    def test_sorted_and_aligned(self):
+        pairs = [('GET', '/b'), ('DELETE', '/a')]
+        expected = '    DELETE /a\n    GET    /b'
+        self.assertEqual(server.fmt_pairs(pairs), expected)
+
+    def test_sort_key_with_iterator(self):
+        pairs = iter([('A', 3), ('B', 5), ('Z', 1)])
+        result = server.fmt_pairs(pairs, indent=0,
+                                  sort_key=lambda pair: pair[1])
+        self.assertEqual(result, 'Z 1\nA 3\nB 5')
+
+
 def get_free_port(host="localhost"):
     """Get a free port on the machine."""
     temp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
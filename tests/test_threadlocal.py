@@ -14,11 +14,18 @@
 
 """Tests for threadlocal dict module."""
 
+import copy
 import random
 import string
+import sys
 import threading
 import unittest
 
+try:
+    from collections import abc as collections_abc
+except ImportError:  # python 2
+    import collections as collections_abc
+
 from six.moves import queue
 from six.moves import xrange
 
@@ -105,5 +112,74 @@ class TestThreadLocal(unittest.TestCase):
         instance_two = threadlocal.ThreadLocalDict(namespace)
         self.assertIsNot(instance_one, instance_two)
 
+    def test_dict_methods(self):
+        tld = threadlocal.ThreadLocalDict(self.get_some_text())
+        self.assertIsInstance(tld, collections_abc.MutableMapping)
+        tld.update(one=1, two=2)
+        self.assertIn('one', tld)
+        self.assertEqual(tld.get('two'), 2)
+        self.assertEqual(sorted(tld.items()), [('one', 1), ('two', 2)])
+        self.assertEqual(tld.pop('one'), 1)
+        self.assertIsNone(tld.pop('one', None))
+        self.assertEqual(tld.setdefault('three', 3), 3)
+        self.assertEqual(sorted(tld.keys()), ['three', 'two'])
+        self.assertEqual(sorted(tld.values()), [2, 3])
+        self.assertIn(tld.popitem(), [('two', 2), ('three', 3)])
+        self.assertEqual(len(tld), 1)
+        self.assertEqual(tld, {'two': 2})
+        tld.clear()
+        self.assertEqual(len(tld), 0)
+
+    def test_slots(self):
+        tld = threadlocal.ThreadLocalDict(self.get_some_text(), one=1)
+        self.assertFalse(hasattr(tld, '__dict__'))
+        with self.assertRaises(AttributeError):
+            tld.not_a_slot = True
+        duplicate = copy.copy(tld)
+        self.assertEqual(duplicate.namespace, tld.namespace)
+        self.assertEqual(duplicate, {'one': 1})
+
+    @unittest.skipIf(sys.version_info < (3, 9), "asyncio.to_thread is 3.9+")
+    def test_to_thread_does_not_leak(self):
+        import asyncio
+
+        tld = threadlocal.default()
+        tld['user'] = 'main'
+
+        def worker():
+            seen = tld.get('user')
+            tld['user'] = 'worker'
+            return seen
+
+        seen = asyncio.run(asyncio.to_thread(worker))
+        self.assertIsNone(seen)
+        self.assertEqual(tld['user'], 'main')
+
+    @unittest.skipIf(sys.version_info < (3, 5), "types.coroutine is 3.5+")
+    def test_tasks_on_one_thread_share_data(self):
+        import asyncio
+        import types
+
+        tld = threadlocal.new(self.get_some_text())
+        seen = []
+
+        @types.coroutine
+        def task(value):
+            tld['value'] = value
+            yield  # let the other task run
+            seen.append((tld['value'], tld._get_local_dict()))
+
+        loop = asyncio.new_event_loop()
+        try:
+            tasks = [asyncio.ensure_future(task(value), loop=loop)
+                     for value in (1, 2)]
+            loop.run_until_complete(asyncio.wait(tasks))
+        finally:
+            loop.close()
+        (first, first_dict), (second, second_dict) = seen
+        # the data is local to the thread, not to each task
+        self.assertIs(first_dict, second_dict)
+        self.assertEqual((first, second), (2, 2))
+
 if __name__ == '__main__':
     unittest.main()